@@ -4,6 +4,8 @@ import math
 from dataclasses import dataclass
 from aiohttp import web
 
+from waves import WaveConfig, SpawnSchedule
+
 
 @dataclass
 class Vec3:
@@ -299,6 +301,8 @@ class Game:
     broadcast: GameBroadcasts = GameBroadcasts()
     # Last enemy identifier
     last_enemy_id: int = 0
+    # Enemies to spawn during the game, generated when the game is created
+    schedule: SpawnSchedule
 
     # If the game is over
     is_over: bool = False
@@ -309,7 +313,8 @@ class Game:
     def enemy_list(self): return list(self.enemies.values())
 
     # A game can only be created with a list of players
-    def __init__(self, players: list[str], clients: list[web.WebSocketResponse]):
+    def __init__(self, players: list[str], clients: list[web.WebSocketResponse],
+                 waves: WaveConfig, seed: int | None = None):
         # Create a game identifier for the logs, to differentiate the games
         self.logger = Logger(random.randint(1000, 9999))
 
@@ -334,37 +339,37 @@ class Game:
             player.rotation = rotation
             self.players[username] = player
 
+        # Generate all the enemies of the game in advance
+        if seed is None:
+            seed = random.getrandbits(32)
+        targets = [(player.position.x, player.position.y, player.position.z)
+                   for player in self.player_list]
+        self.schedule = SpawnSchedule(waves, targets, self.duration, seed)
+        self.logger.log(
+            f"Generated {len(self.schedule)} enemies with seed {seed}")
+
     async def start(self):
         """Starts the game and broadcasts the start of the game to all the players."""
         self.time = 0
         await self.broadcast.game_started(self.player_list)
 
-    async def spawn_enemy(self):
-        """Creates a new random enemy and adds it to the game."""
-        # Decide who to target.
-        player: Player = random.choice(self.player_list)
-
-        # Decide the position of the enemy
-        # TODO Use a more intelligent algorithm
-        x = random.uniform(-4, 4)
-        y = random.uniform(-3, 3)
-        z = random.uniform(-4, 4)
-
-        r = random.randint(96, 255) * 0x10000
-        g = random.randint(96, 255) * 0x100
-        b = random.randint(96, 255)
-        color = r + g + b
+    async def spawn_enemy(self, index: int):
+        """Adds the enemy at the given index of the schedule to the game."""
+        schedule = self.schedule
 
         # Create the enemy
         enemy = Enemy(
             id=self.last_enemy_id,
-            # TODO Define color and health based on some logic
-            health=1,
-            color=color,
-            source=Vec3(x, y, z),
-            target=player.position,
-            start_time=self.time,
-            speed=0.0001
+            health=schedule.health[index],
+            color=schedule.colors[index],
+            source=Vec3(schedule.source_x[index],
+                        schedule.source_y[index],
+                        schedule.source_z[index]),
+            target=Vec3(schedule.target_x[index],
+                        schedule.target_y[index],
+                        schedule.target_z[index]),
+            start_time=schedule.times[index],
+            speed=schedule.speeds[index]
         )
         self.last_enemy_id += 1
 
@@ -391,10 +396,13 @@ class Game:
 
             return True
 
-        # Spawn a new enemy every second
+        # Synchronize the clients every two seconds
         if self.time % 2000 == 0:
             await self.broadcast.time_sync(self.time)
-            await self.spawn_enemy()
+
+        # Spawn the enemies scheduled up to now
+        for index in self.schedule.due(self.time):
+            await self.spawn_enemy(index)
 
         # Compute the distance between each player and each enemy
         for player in self.player_list:
@@ -2,6 +2,7 @@ import asyncio
 from aiohttp import web, WSMessage, WSMsgType
 
 from game import Game, Vec3, Logger
+from waves import WaveConfig
 
 L = Logger()
 
@@ -11,8 +12,11 @@ class GamesServer:
     app: web.Application
     # Players who are logged in as sockets
     players: dict[str, web.WebSocketResponse] = {}
+    # Difficulty curves used to generate the enemies of every game
+    waves: WaveConfig
 
     def __init__(self, port: int):
+        self.waves = WaveConfig.load()
         self.app = web.Application()
         self.app.router.add_get('/', self.websocket_handler)
         L.log("Server starting on port 8080")
@@ -146,7 +150,7 @@ class GamesServer:
                 await self.send_message(player2, 'matched', player1)
 
                 # Create a new game
-                game = Game([player1, player2], [socket1, socket2])
+                game = Game([player1, player2], [socket1, socket2], self.waves)
 
                 self.open_games[player1] = game
                 self.open_games[player2] = game
@@ -0,0 +1,164 @@
+import json
+import os
+import random
+from array import array
+from dataclasses import dataclass
+
+
+# Default location of the difficulty curves, next to the server sources
+DEFAULT_WAVES_PATH = os.path.join(os.path.dirname(__file__), 'waves.json')
+
+
+def _range(data: dict, key: str, default: tuple[float, float]) -> tuple[float, float]:
+    """Reads a `[min, max]` pair from the config, making sure it is well formed."""
+    value = data.get(key, default)
+    if len(value) != 2 or value[0] > value[1]:
+        raise ValueError(f"Invalid range for `{key}`: {value}")
+    return (value[0], value[1])
+
+
+@dataclass
+class Wave:
+    # Time (in ms) at which the wave starts
+    start: int
+    # Time (in ms) between two consecutive spawns
+    interval: int
+    # Number of enemies created at every spawn
+    burst: int
+    # Range of the health of the enemies
+    health: tuple[int, int]
+    # Range of the speed of the enemies
+    speed: tuple[float, float]
+
+    @staticmethod
+    def from_dict(data: dict) -> 'Wave':
+        wave = Wave(
+            start=int(data.get('start', 0)),
+            interval=int(data['interval']),
+            burst=int(data.get('burst', 1)),
+            health=tuple(map(int, _range(data, 'health', (1, 1)))),
+            speed=_range(data, 'speed', (0.0001, 0.0001))
+        )
+
+        if wave.interval <= 0:
+            raise ValueError(f"Wave interval must be positive, got {wave.interval}")
+        if wave.burst <= 0:
+            raise ValueError(f"Wave burst must be positive, got {wave.burst}")
+        if wave.health[0] <= 0:
+            raise ValueError(f"Enemy health must be positive, got {wave.health}")
+        return wave
+
+
+@dataclass
+class WaveConfig:
+    # Waves sorted by starting time, each one lasting until the next one starts
+    waves: list[Wave]
+    # Ranges of the source positions of the enemies for each axis
+    source_x: tuple[float, float]
+    source_y: tuple[float, float]
+    source_z: tuple[float, float]
+    # Range of each color channel of the enemies
+    color: tuple[int, int]
+
+    @staticmethod
+    def load(path: str = DEFAULT_WAVES_PATH) -> 'WaveConfig':
+        """Loads the difficulty curves from a JSON file."""
+        with open(path) as file:
+            data = json.load(file)
+
+        waves = sorted((Wave.from_dict(wave) for wave in data['waves']),
+                       key=lambda wave: wave.start)
+        if len(waves) == 0:
+            raise ValueError(f"No waves defined in {path}")
+
+        return WaveConfig(
+            waves=waves,
+            source_x=_range(data, 'source_x', (-4, 4)),
+            source_y=_range(data, 'source_y', (-3, 3)),
+            source_z=_range(data, 'source_z', (-4, 4)),
+            color=tuple(map(int, _range(data, 'color', (96, 255))))
+        )
+
+
+class SpawnSchedule:
+    """The full list of enemies of a game, generated once when the game is created.
+
+    Every enemy is stored as an index into parallel arrays sorted by spawn time,
+    so that spawning during the game loop only needs to advance `next_index`."""
+
+    # Time (in ms) at which each enemy is spawned
+    times: array
+    # Source and target positions of each enemy
+    source_x: array
+    source_y: array
+    source_z: array
+    target_x: array
+    target_y: array
+    target_z: array
+    # Color, health and speed of each enemy
+    colors: array
+    health: array
+    speeds: array
+
+    # Index of the next enemy to spawn
+    next_index: int
+
+    def __init__(self, config: WaveConfig, targets: list[tuple[float, float, float]],
+                 duration: int, seed: int):
+        rng = random.Random(seed)
+
+        self.times = array('q')
+        self.source_x = array('d')
+        self.source_y = array('d')
+        self.source_z = array('d')
+        self.target_x = array('d')
+        self.target_y = array('d')
+        self.target_z = array('d')
+        self.colors = array('l')
+        self.health = array('l')
+        self.speeds = array('d')
+        self.next_index = 0
+
+        waves = config.waves
+        for (i, wave) in enumerate(waves):
+            end = waves[i + 1].start if i + 1 < len(waves) else duration
+            end = min(end, duration)
+
+            for time in range(wave.start, end, wave.interval):
+                for _ in range(wave.burst):
+                    # Decide who to target
+                    tx, ty, tz = rng.choice(targets)
+
+                    # Decide the position of the enemy
+                    # TODO Use a more intelligent algorithm
+                    x = rng.uniform(*config.source_x)
+                    y = rng.uniform(*config.source_y)
+                    z = rng.uniform(*config.source_z)
+
+                    r = rng.randint(*config.color) * 0x10000
+                    g = rng.randint(*config.color) * 0x100
+                    b = rng.randint(*config.color)
+
+                    self.times.append(time)
+                    self.source_x.append(x)
+                    self.source_y.append(y)
+                    self.source_z.append(z)
+                    self.target_x.append(tx)
+                    self.target_y.append(ty)
+                    self.target_z.append(tz)
+                    self.colors.append(r + g + b)
+                    self.health.append(rng.randint(*wave.health))
+                    self.speeds.append(rng.uniform(*wave.speed))
+
+    def __len__(self):
+        return len(self.times)
+
+    def due(self, time: int) -> range:
+        """Returns the indices of the enemies that have to be spawned by `time`
+        and advances the schedule past them."""
+        start = end = self.next_index
+        while end < len(self.times) and self.times[end] <= time:
+            end += 1
+
+        self.next_index = end
+        return range(start, end)